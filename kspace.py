@@ -1,5 +1,10 @@
+import os
 import sys
 import pathlib
+import itertools
+import re
+import threading
+from functools import partial
 from uuid import uuid4
 
 import logging.config
@@ -9,10 +14,14 @@ import pydicom
 from pydicom import errors
 from PIL import Image
 from PyQt5 import QtQuick
-from PyQt5.QtCore import QObject, pyqtSlot, QVariant, QUrl, \
-    qInstallMessageHandler, Qt
+try:
+    from PyQt5 import sip
+except ImportError:  # PyQt5 older than 5.11 uses the standalone sip module
+    import sip
+from PyQt5.QtCore import QObject, pyqtSlot, pyqtSignal, QVariant, QUrl, \
+    qInstallMessageHandler, Qt, QRunnable, QThreadPool, QTimer
 from PyQt5.QtGui import QImage, QPixmap, QColor, QIcon
-from PyQt5.QtQml import QQmlApplicationEngine
+from PyQt5.QtQml import QQmlApplicationEngine, QQmlProperty
 from PyQt5.QtWidgets import QApplication, QMessageBox
 
 # Logging setup
@@ -34,18 +43,215 @@ else:
     log.info('Pillow: n/a, PyQt5: n/a, numpy: n/a, pydicom: n/a')
 
 
-# Attempting to use mkl_fft (faster FFT library for Intel CPUs). Fallback is np
+# FFT functions: scipy.fft is multithreaded and uses mkl_fft as its backend
+# when available (faster FFT library for Intel CPUs), otherwise pyFFTW.
+# Without scipy the numpy interfaces of mkl_fft or pyFFTW are used, the
+# fallback is np.fft
+def enable_fftw_cache():
+    """Sets up pyFFTW to plan each transform size only once
+
+    FFTW_MEASURE planning takes a while, but it is only done for the first
+    transform of each image size and the tuned plans are kept in the cache.
+    """
+    pyfftw.config.NUM_THREADS = os.cpu_count() or 1
+    pyfftw.config.PLANNER_EFFORT = 'FFTW_MEASURE'
+    pyfftw.interfaces.cache.enable()
+    pyfftw.interfaces.cache.set_keepalive_time(60)
+
+
 try:
-    import mkl_fft as m
+    import scipy.fft
+
+    try:
+        import mkl_fft.interfaces.scipy_fft as mkl_backend
 
-    fft2 = m.fft2
-    ifft2 = m.ifft2
+        scipy.fft.set_global_backend(mkl_backend)
+        fft_backend = 'mkl_fft'
+    except (ModuleNotFoundError, ImportError):
+        try:
+            import pyfftw
+            import pyfftw.interfaces.scipy_fft as fftw_backend
+
+            enable_fftw_cache()
+            scipy.fft.set_global_backend(fftw_backend)
+            fft_backend = 'pyfftw'
+        except (ModuleNotFoundError, ImportError):
+            fft_backend = 'scipy'
+
+    fft2 = partial(scipy.fft.fft2, workers=-1)
+    ifft2 = partial(scipy.fft.ifft2, workers=-1)
+    rfft2 = partial(scipy.fft.rfft2, workers=-1)
 except (ModuleNotFoundError, ImportError):
-    fft2 = np.fft.fft2
-    ifft2 = np.fft.ifft2
-finally:
-    fftshift = np.fft.fftshift
-    ifftshift = np.fft.ifftshift
+    try:
+        import mkl_fft.interfaces.numpy_fft as numpy_fft
+
+        fft_backend = 'mkl_fft'
+    except (ModuleNotFoundError, ImportError):
+        numpy_fft = np.fft
+        fft_backend = 'numpy'
+        try:
+            import pyfftw
+            import pyfftw.interfaces.numpy_fft as fftw_numpy
+
+            enable_fftw_cache()
+            fft_backend = 'pyfftw'
+        except (ModuleNotFoundError, ImportError):
+            pass
+
+    if fft_backend == 'pyfftw':
+        def fft2(x, overwrite_x=False):
+            return fftw_numpy.fft2(x, overwrite_input=overwrite_x)
+
+        def ifft2(x, overwrite_x=False):
+            return fftw_numpy.ifft2(x, overwrite_input=overwrite_x)
+
+        rfft2 = fftw_numpy.rfft2
+    else:
+        # numpy style interfaces do not support overwriting the input array
+        def fft2(x, overwrite_x=False):
+            return numpy_fft.fft2(x)
+
+        def ifft2(x, overwrite_x=False):
+            return numpy_fft.ifft2(x)
+
+        rfft2 = numpy_fft.rfft2
+
+log.info(f'FFT backend: {fft_backend}')
+
+# Attempting to use numba to compile fused k-space kernels. Fallback is np
+try:
+    import numba as nb
+
+    log.info(f'numba: {nb.__version__}')
+except (ModuleNotFoundError, ImportError):
+    nb = None
+    log.info('numba: n/a')
+
+# numexpr evaluates the display conversions in single multithreaded passes
+# when numba is not available. Fallback is np
+try:
+    import numexpr as ne
+
+    log.info(f'numexpr: {ne.__version__}')
+except (ModuleNotFoundError, ImportError):
+    ne = None
+    log.info('numexpr: n/a')
+
+if nb:
+    @nb.njit(parallel=True, cache=True, nogil=True)
+    def _fused_filters(kspace, hp_r2, lp_r2, factor, win_rows, win_cols):
+        """Applies high/low pass, undersampling and Hamming filter in one pass
+
+        Parameters:
+            kspace (np.ndarray): Complex kspace ndarray (modified in place)
+            hp_r2 (float): squared high pass radius (negative to disable)
+            lp_r2 (float): squared low pass radius (inf to disable)
+            factor (int): undersampling factor (1 to disable)
+            win_rows (np.ndarray): Hamming window of rows (empty to disable)
+            win_cols (np.ndarray): Hamming window of columns
+        """
+        rows, cols = kspace.shape
+        a, b = rows // 2, cols // 2
+        for i in nb.prange(rows):
+            y = i - a
+            if factor > 1 and y % factor:  # Line is skipped by undersampling
+                kspace[i, :] = 0
+                continue
+            for j in range(cols):
+                x = j - b
+                d2 = x * x + y * y
+                if d2 <= hp_r2 or d2 > lp_r2:
+                    kspace[i, j] = 0
+                elif win_rows.size:
+                    kspace[i, j] *= win_rows[i] * win_cols[j]
+
+    @nb.njit(parallel=True, cache=True, nogil=True)
+    def _kspace_display(k_re, k_im, scaling_c, out):
+        """Calculates the log scaled and normalised kspace magnitude display
+
+        Same as taking the magnitude, log1p(magnitude * scaling_c) and then
+        ImageManipulators.normalise, without intermediate arrays. As log1p is
+        monotonic, the extremes are found from the magnitude in a first pass.
+        The real and imaginary parts are passed as separate float32 views of
+        the complex kspace, so the magnitude is a plain sqrt of the squares.
+
+        Parameters:
+            k_re (np.ndarray): real part of the kspace (kspace.real)
+            k_im (np.ndarray): imaginary part of the kspace (kspace.imag)
+            scaling_c (float): kspace intensity scaling constant
+            out (np.ndarray): uint8 array to store the display values
+        """
+        rows, cols = k_re.shape
+        row_min = np.empty(rows)
+        row_max = np.empty(rows)
+        for i in nb.prange(rows):
+            a_min, a_max = np.inf, 0.
+            for j in range(cols):
+                a = np.sqrt(k_re[i, j] * k_re[i, j] + k_im[i, j] * k_im[i, j])
+                a_min = min(a_min, a)
+                a_max = max(a_max, a)
+            row_min[i], row_max[i] = a_min, a_max
+
+        f_min = np.log1p(row_min.min() * scaling_c)
+        f_max = np.log1p(row_max.max() * scaling_c)
+        coeff = f_max - f_min
+        for i in nb.prange(rows):
+            for j in range(cols):
+                a = np.sqrt(k_re[i, j] * k_re[i, j] + k_im[i, j] * k_im[i, j])
+                f = np.log1p(a * scaling_c)
+                if coeff:
+                    f = np.floor((f - f_min) / coeff * 255.)
+                out[i, j] = min(max(f, 0.), 255.)
+
+    @nb.njit(parallel=True, cache=True, nogil=True)
+    def _image_display(img, ww, wc, out):
+        """Applies the window to the image and writes the uint8 display
+
+        Same as ImageManipulators.apply_window on a copy of the image followed
+        by the conversion to uint8, but without the intermediate copy.
+
+        Parameters:
+            img (np.ndarray): image to be windowed (not modified)
+            ww (float): window width as a fraction of the maximum intensity
+            wc (float): window center as a fraction of the maximum intensity
+            out (np.ndarray): uint8 array to store the display values
+        """
+        rows, cols = img.shape
+        row_min = np.empty(rows)
+        row_max = np.empty(rows)
+        for i in nb.prange(rows):
+            a_min, a_max = np.inf, -np.inf
+            for j in range(cols):
+                a_min = min(a_min, img[i, j])
+                a_max = max(a_max, img[i, j])
+            row_min[i], row_max[i] = a_min, a_max
+
+        f_max = row_max.max()
+        windowed = f_max != row_min.min()
+        ww, wc = ww * f_max, wc * f_max
+        for i in nb.prange(rows):
+            for j in range(cols):
+                f = img[i, j]
+                if windowed:
+                    if ww:
+                        f = min(max(((f - wc) / ww + 0.5) * 255., 0.), 255.)
+                    else:
+                        f = 255. if f > wc else 0.
+                out[i, j] = min(max(f, 0.), 255.)
+
+    def compile_kernels():
+        """Compiles the numba kernels (or loads them from the cache)
+
+        The kernels are run once on a tiny k-space, so the first display
+        update does not have to wait for the compilation.
+        """
+        kspace = np.zeros((2, 2), dtype=np.complex64)
+        ImageManipulators.fused_filters(kspace, 0, 100, 1, False)
+        ImageManipulators.fused_filters(kspace, 0, 100, 1, True)
+        _kspace_display(kspace.real, kspace.imag, 1.,
+                        np.zeros((2, 2), dtype=np.uint8))
+        _image_display(np.zeros((2, 2), dtype=np.float32), 1., .5,
+                       np.zeros((2, 2), dtype=np.uint8))
 
 
 def qt_msgbox(text='', fatal=False):
@@ -87,7 +293,7 @@ def open_file(path: str, dtype: np.dtype = np.float32) -> np.ndarray:
         log.info(f'Opening file: {path}')
         with Image.open(path) as f:
             img_file = f.convert('F')  # 'F' mode: 32-bit floating point pixels
-            img_pixel_array = np.array(img_file).astype(dtype)
+            img_pixel_array = np.array(img_file, dtype=dtype)
         log.info(f"Image loaded. Image size: {img_pixel_array.shape}")
         return img_pixel_array
     except FileNotFoundError:
@@ -98,7 +304,8 @@ def open_file(path: str, dtype: np.dtype = np.float32) -> np.ndarray:
         log.info(f'Filetype is not recognised by PIL. Trying pydicom.')
         try:
             with pydicom.dcmread(path) as dcm_file:
-                img_pixel_array = dcm_file.pixel_array.astype(dtype)
+                img_pixel_array = \
+                    dcm_file.pixel_array.astype(dtype, copy=False)
             img_pixel_array.setflags(write=True)
             log.info(f"DICOM loaded. Image size: {img_pixel_array.shape}")
             return img_pixel_array
@@ -113,6 +320,44 @@ def open_file(path: str, dtype: np.dtype = np.float32) -> np.ndarray:
                 raise e
 
 
+def open_cached(path: str, dtype: np.dtype = np.float32) -> np.ndarray:
+    """Loads image data with open_file and keeps a decoded copy as .npy
+
+    Decoding DICOM files is slow, so the loaded array is saved next to the
+    file (with .npy extension) and the copy is loaded instead while it is
+    not older than the file.
+
+    Parameters:
+        path (str): The image file location
+        dtype (np.dtype): image array dtype (e.g. np.float64)
+
+    Returns:
+        np.ndarray: a floating point NumPy ndarray of the specified dtype
+    """
+    npy_path = os.path.splitext(path)[0] + '.npy'
+    try:
+        if os.path.getmtime(npy_path) >= os.path.getmtime(path):
+            log.info(f'Opening decoded copy: {npy_path}')
+            # Copied from the memory map, the array is resized in place
+            return np.array(np.load(npy_path, mmap_mode='r'), dtype=dtype)
+    except (OSError, ValueError, EOFError):
+        # No usable copy (e.g. missing or truncated), the file is decoded
+        log.info(f'No usable decoded copy: {npy_path}')
+
+    img_pixel_array = open_file(path, dtype)
+    if img_pixel_array is not None:
+        # Written to a temporary file first, so an interrupted save can not
+        # leave an incomplete copy behind under the final name
+        part_path = npy_path + '.part'
+        try:
+            with open(part_path, 'wb') as f:
+                np.save(f, img_pixel_array, allow_pickle=False)
+            os.replace(part_path, npy_path)
+        except OSError:
+            log.info(f'Cannot save decoded copy: {npy_path}', exc_info=True)
+    return img_pixel_array
+
+
 class ImageManipulators:
     """A class that contains a 2D image and kspace pair and modifier methods
 
@@ -121,29 +366,63 @@ class ImageManipulators:
     initialized for new images.
     """
 
-    def __init__(self, pixel_data: np.ndarray, is_image: bool = True):
+    # Hamming windows (row, column) keyed by k-space shape
+    _hamming_cache: dict = {}
+    # Line orders of centric k-space filling keyed by number of lines
+    _centric_cache: dict = {}
+    # Squared distances from the k-space center keyed by shape
+    _r2_cache: dict = {}
+    # High/low pass filter masks keyed by (shape, radius, outside)
+    _mask_cache: dict = {}
+    _mask_cache_size = 16
+    # Phase ramps replacing FFT shifts keyed by shape
+    _ramp_cache: dict = {}
+    # Random number generator for the noise maps
+    _rng = np.random.default_rng()
+    # Versions of the display data, unique across all instances
+    _versions = itertools.count(1)
+
+    def __init__(self, pixel_data: np.ndarray, is_image: bool = True,
+                 copy: bool = True):
         """Opening the image and initializing variables based on image size
 
+        The image array is modified and resized in place, so it is copied
+        unless the caller does not keep a reference to it (copy=False). Raw
+        data is always copied as it is usually a slice of a 3D array. K-space
+        is stored in single precision (complex64) regardless of the input.
+
         Parameters:
             pixel_data (np.ndarray): 2D pixel data of image or kspace
             is_image (bool): True if the data is an Image, false if raw data
+            copy (bool): False if pixel_data can be used without a copy
         """
 
         if is_image:
-            self.img = pixel_data.copy()
+            self.img = pixel_data.copy() if copy else pixel_data
             self.kspacedata = np.zeros_like(self.img, dtype=np.complex64)
         else:
-            self.kspacedata = pixel_data.copy()
+            self.kspacedata = pixel_data.astype(np.complex64)
             self.img = np.zeros_like(self.kspacedata, dtype=np.float32)
 
-        self.image_display_data = np.require(self.img, np.uint8, 'C')
-        self.kspace_display_data = np.zeros_like(self.image_display_data)
+        # uint8 display arrays are only written in place (QImage reads them)
+        self.image_display_data = np.empty(self.img.shape, dtype=np.uint8)
+        self.kspace_display_data = np.empty_like(self.image_display_data)
         self.orig_kspacedata = np.zeros_like(self.kspacedata)
-        self.kspace_abs = np.zeros_like(self.kspacedata, dtype=np.float32)
-        self.noise_map = np.zeros_like(self.kspace_abs)
+        # Intermediate k-space magnitude and windowed image are not needed by
+        # the numba kernels
+        self.kspace_abs = None if nb else \
+            np.zeros_like(self.kspacedata, dtype=np.float32)
+        self.img_windowed = None if nb else np.empty_like(self.img)
+        self.noise_map = np.zeros_like(self.kspacedata, dtype=np.float32)
+        # Scratch array of the inverse FFT, pyFFTW plans have their own
+        self._fft_scratch = None if fft_backend == 'pyfftw' else \
+            np.empty_like(self.kspacedata)
+        self._ifft_plans = {}
         self.signal_to_noise = 30
         self.spikes = []
         self.patches = []
+        # Modifier parameters img and kspacedata were last calculated with
+        self.applied_modifiers = None
 
         if is_image:
             self.np_fft(self.img, self.kspacedata)
@@ -152,24 +431,159 @@ class ImageManipulators:
 
         self.orig_kspacedata[:] = self.kspacedata  # Store data write-protected
         self.orig_kspacedata.setflags(write=False)
+        # Lines of kspacedata that differ from the original k-space
+        self.dirty_rows = np.zeros(self.kspacedata.shape[0], dtype=bool)
+        # Held while the display arrays are written or read by the UI
+        self.display_lock = threading.Lock()
 
         self.prepare_displays()
 
     @staticmethod
-    def np_ifft(kspace: np.ndarray, out: np.ndarray):
+    def shift_ramp(n: int):
+        """Returns the 1D phase ramps that replace the FFT shifts of length n
+
+        With m = n // 2, the ramps are exp(2πi·m·k/n) before and
+        exp(2πi·m·(k-m)/n) after the transform. For even n these are the
+        real (-1)^k and (-1)^(k-m) patterns.
+
+        Parameters:
+            n (int): length of the transformed axis
+        """
+        m, k = n // 2, np.arange(n)
+        pre = 2 * np.pi * (m * k % n) / n
+        post = 2 * np.pi * (m * (k - m) % n) / n
+        if n % 2 == 0:
+            return np.rint(np.cos(pre)), np.rint(np.cos(post))
+        return np.exp(1j * pre), np.exp(1j * post)
+
+    @classmethod
+    def shift_ramps(cls, shape: (int, int)):
+        """Returns cached phase ramps that replace FFT shifts
+
+        Shifting the zero frequency to the center (fftshift) is the same as
+        multiplying the other domain by a phase ramp. With m = n // 2:
+            fftshift(fft(ifftshift(x)))[k] =
+                exp(2πi·m·(k-m)/n) · fft(x · exp(2πi·m·j/n))[k]
+        For even sized arrays the ramps are real (-1)^(row+column)
+        checkerboard patterns. The inverse FFT only needs the magnitude, so
+        it uses no ramps (see fftshift_abs).
+
+        Parameters:
+            shape (int, int): shape of the arrays to be transformed
+
+        Returns:
+            tuple: (before FFT, after FFT) ramp arrays
+        """
+        ramps = cls._ramp_cache.get(shape)
+        if ramps is None:
+            rows, cols = shape
+            dtype = np.complex64 if rows % 2 or cols % 2 else np.float32
+            (pre_r, post_r), (pre_c, post_c) = map(cls.shift_ramp, shape)
+            pre = np.outer(pre_r, pre_c).astype(dtype)
+            post = np.outer(post_r, post_c).astype(dtype)
+            for ramp in (pre, post):
+                ramp.setflags(write=False)
+            ramps = cls._ramp_cache[shape] = (pre, post)
+        return ramps
+
+    def np_ifft(self, kspace: np.ndarray, out: np.ndarray,
+                preview_scale: int = 1):
         """Performs inverse FFT function (kspace to [magnitude] image)
 
         Performs iFFT on the input data and updates the display variables for
         the image domain (magnitude) image and the kspace as well.
+        The transform is calculated in a preallocated scratch array (or the
+        buffer of the FFTW plan when pyFFTW is used).
 
         Parameters:
             kspace (np.ndarray): Complex kspace ndarray
             out (np.ndarray): Array to store values
+            preview_scale (int): values above 1 reconstruct a low resolution
+                preview (see preview_ifft)
         """
-        np.absolute(fftshift(ifft2(ifftshift(kspace))), out=out)
+        if preview_scale > 1:
+            self.preview_ifft(kspace, out, preview_scale)
+            return
+
+        # The ifftshift of the kspace does not alter the magnitude and the
+        # fftshift of the image is done while the magnitude is written
+        if fft_backend == 'pyfftw':
+            plan = self.ifft_plan(kspace.shape)
+            np.copyto(plan.input_array, kspace)
+            self.fftshift_abs(plan(), out)
+        else:
+            np.copyto(self._fft_scratch, kspace)
+            self.fftshift_abs(ifft2(self._fft_scratch, overwrite_x=True), out)
 
     @staticmethod
-    def np_fft(img: np.ndarray, out: np.ndarray):
+    def fftshift_abs(x: np.ndarray, out: np.ndarray):
+        """Writes the magnitude of x shifted as np.fft.fftshift would
+
+        The four quadrants are written to their shifted place directly, so
+        no separate pass over the array is needed for the shift.
+
+        Parameters:
+            x (np.ndarray): Complex array (e.g. result of the iFFT)
+            out (np.ndarray): Array to store values (same shape as x)
+        """
+        rows, cols = x.shape
+        r, c = rows // 2, cols // 2
+        t_r, t_c = rows - r, cols - c
+        np.absolute(x[:t_r, :t_c], out=out[r:, c:])
+        np.absolute(x[:t_r, t_c:], out=out[r:, :c])
+        np.absolute(x[t_r:, :t_c], out=out[:r, c:])
+        np.absolute(x[t_r:, t_c:], out=out[:r, :c])
+
+    def preview_ifft(self, kspace: np.ndarray, out: np.ndarray, scale: int):
+        """Performs a low resolution inverse FFT from the kspace centre
+
+        Only the central 1/scale part of the kspace is transformed in both
+        directions (about 1/scale^2 of the work of the full transform) and
+        the magnitude image is enlarged to the shape of out by nearest
+        neighbour sampling.
+
+        Parameters:
+            kspace (np.ndarray): Complex kspace ndarray
+            out (np.ndarray): Array to store values
+            scale (int): downsampling factor of the preview
+        """
+        rows, cols = kspace.shape
+        p_rows, p_cols = max(rows // scale, 1), max(cols // scale, 1)
+        r0, c0 = rows // 2 - p_rows // 2, cols // 2 - p_cols // 2
+        centre = kspace[r0:r0 + p_rows, c0:c0 + p_cols]
+        small = np.empty(centre.shape, dtype=np.float32)
+        if fft_backend == 'pyfftw':
+            plan = self.ifft_plan(centre.shape)
+            np.copyto(plan.input_array, centre)
+            self.fftshift_abs(plan(), small)
+        else:
+            self.fftshift_abs(ifft2(centre), small)
+        # Keeps the intensity of the full resolution image
+        small *= p_rows * p_cols / (rows * cols)
+        out[:] = small[np.ix_(np.arange(rows) * p_rows // rows,
+                              np.arange(cols) * p_cols // cols)]
+
+    def ifft_plan(self, shape: (int, int)):
+        """Returns the in-place inverse FFTW plan of the shape (needs pyFFTW)
+
+        The plan is measured once per shape and it is kept by the instance
+        with its own aligned buffer. Plans are not shared between instances,
+        so they are never executed by two threads at the same time.
+
+        Parameters:
+            shape (int, int): shape of the k-space
+        """
+        plan = self._ifft_plans.get(shape)
+        if plan is None:
+            buffer = pyfftw.empty_aligned(shape, dtype=np.complex64)
+            plan = pyfftw.FFTW(buffer, buffer, axes=(0, 1),
+                               direction='FFTW_BACKWARD',
+                               flags=('FFTW_MEASURE',),
+                               threads=pyfftw.config.NUM_THREADS)
+            self._ifft_plans[shape] = plan
+        return plan
+
+    def np_fft(self, img: np.ndarray, out: np.ndarray):
         """ Performs FFT function (image to kspace)
 
         Performs FFT function, FFT shift and stores the unmodified kspace data
@@ -179,7 +593,19 @@ class ImageManipulators:
             img (np.ndarray): The NumPy ndarray to be transformed
             out (np.ndarray): Array to store output (must be same shape as img)
         """
-        out[:] = fftshift(fft2(ifftshift(img)))
+        pre, post = self.shift_ramps(img.shape)
+        if np.iscomplexobj(img) or np.iscomplexobj(pre):
+            np.multiply(img, pre, out=out)
+            np.multiply(fft2(out, overwrite_x=True), post, out=out)
+        else:
+            # The FFT of a real image is Hermitian symmetric, X[k] is
+            # conj(X[-k]), so only half of the columns are transformed
+            rows, cols = img.shape
+            half = cols // 2 + 1
+            out[:, :half] = rfft2(img * pre)
+            src = np.ix_(-np.arange(rows) % rows, cols - np.arange(half, cols))
+            np.conj(out[src], out=out[:, half:])
+            np.multiply(out, post, out=out)
 
     @staticmethod
     def normalise(f: np.ndarray):
@@ -192,7 +618,11 @@ class ImageManipulators:
         fmax = float(np.max(f))
         if fmax != fmin:
             coeff = fmax - fmin
-            f[:] = np.floor((f[:] - fmin) / coeff * 255.)
+            # In place, without temporary arrays
+            f -= fmin
+            f /= coeff
+            f *= 255.
+            np.floor(f, out=f)
 
     @staticmethod
     def apply_window(f: np.ndarray, window_val: dict = None):
@@ -221,10 +651,20 @@ class ImageManipulators:
         if fmax != fmin:
             ww = (window_val['ww'] * fmax) if window_val else fmax
             wc = (window_val['wc'] * fmax) if window_val else (ww / 2)
-            w_low = wc - ww / 2
-            w_high = wc + ww / 2
-            f[:] = np.piecewise(f, [f <= w_low, f > w_high], [0, 255,
-                                lambda x: ((x - wc) / ww + 0.5) * 255])
+            if ww:
+                # The linear mapping is monotonic, so clipping its result is
+                # the same as setting values outside the window to 0 and 255
+                if ne:
+                    ne.evaluate('((f - wc) / ww + 0.5) * 255.', out=f,
+                                casting='same_kind')
+                else:
+                    f -= wc
+                    f /= ww
+                    f += 0.5
+                    f *= 255.
+                np.clip(f, 0, 255, out=f)
+            else:
+                f[:] = (f > wc) * 255.
 
     def prepare_displays(self, kscale: int = -3, lut: dict = None):
         """ Prepares kspace and image for display in the user interface
@@ -242,20 +682,49 @@ class ImageManipulators:
             lut (dict): window width and window center dict
         """
 
-        # 1. Apply window to image
-        self.apply_window(self.img, lut)
+        # 1. Apply window to a copy of the image, so display only changes can
+        # reuse the image (numba applies it with the uint8 conversion)
+        if not nb:
+            np.copyto(self.img_windowed, self.img)
+            self.apply_window(self.img_windowed, lut)
 
         # 2. Prepare kspace display - get magnitude then scale and normalise
         # K-space scaling: https://homepages.inf.ed.ac.uk/rbf/HIPR2/pixlog.htm
-        np.absolute(self.kspacedata, out=self.kspace_abs)
-        if np.any(self.kspace_abs):
-            scaling_c = np.power(10., kscale)
-            np.log1p(self.kspace_abs * scaling_c, out=self.kspace_abs)
-            self.normalise(self.kspace_abs)
-
-        # 3. Obtain uint8 type arrays for QML display
-        self.image_display_data[:] = np.require(self.img, np.uint8)
-        self.kspace_display_data[:] = np.require(self.kspace_abs, np.uint8)
+        scaling_c = np.power(10., kscale)
+        if not nb and ne:
+            # Normalised without flooring, the uint8 conversion truncates
+            k, k_abs = self.kspacedata, self.kspace_abs
+            ne.evaluate('log1p(sqrt(re * re + im * im) * c)',
+                        local_dict={'re': k.real, 'im': k.imag,
+                                    'c': scaling_c},
+                        out=k_abs, casting='same_kind')
+            k_min, k_max = float(np.min(k_abs)), float(np.max(k_abs))
+            if k_max != k_min:
+                ne.evaluate('(k_abs - k_min) * (255. / (k_max - k_min))',
+                            out=k_abs, casting='same_kind')
+        elif not nb:
+            np.absolute(self.kspacedata, out=self.kspace_abs)
+            if np.any(self.kspace_abs):
+                self.kspace_abs *= scaling_c
+                np.log1p(self.kspace_abs, out=self.kspace_abs)
+                self.normalise(self.kspace_abs)
+
+        # 3. Obtain uint8 type arrays for QML display (saturating conversion
+        # straight into the display arrays)
+        with self.display_lock:
+            if nb:
+                # Writes the uint8 display arrays directly
+                ww, wc = (lut['ww'], lut['wc']) if lut else (1., .5)
+                _image_display(self.img, ww, wc, self.image_display_data)
+                k = self.kspacedata
+                _kspace_display(k.real, k.imag, scaling_c,
+                                self.kspace_display_data)
+            else:
+                np.clip(self.img_windowed, 0, 255,
+                        out=self.image_display_data, casting='unsafe')
+                np.clip(self.kspace_abs, 0, 255, out=self.kspace_display_data,
+                        casting='unsafe')
+            self.version = next(self._versions)
 
     def resize_arrays(self, size: (int, int)):
         """ Resize arrays for image size changes (e.g. remove kspace lines etc.)
@@ -268,14 +737,42 @@ class ImageManipulators:
         Parameters:
             size (int, int): size of the new array
         """
-        self.img.resize(size)
-        self.image_display_data.resize(size)
-        self.kspace_display_data.resize(size)
-        self.kspace_abs.resize(size)
+        # The image and the displays are reallocated instead of resized in
+        # place, as the UI thread may still reference them (e.g. a pixmap
+        # being created). Their contents are rebuilt by the next update
+        with self.display_lock:
+            self.img = np.empty(size, dtype=self.img.dtype)
+            self.image_display_data = np.empty(size, dtype=np.uint8)
+            self.kspace_display_data = np.empty(size, dtype=np.uint8)
+        if self.kspace_abs is not None:
+            # Reallocated, as numexpr may still reference the out array of
+            # its last call (the contents are rebuilt by prepare_displays)
+            self.kspace_abs = np.empty(size, dtype=self.kspace_abs.dtype)
+            self.img_windowed = np.empty(size, dtype=self.img_windowed.dtype)
         self.kspacedata.resize(size, refcheck=False)
+        if self._fft_scratch is not None:
+            self._fft_scratch.resize(size, refcheck=False)
+
+    def reset_kspace(self):
+        """ Restores the original k-space before applying the modifiers
+
+        Only the lines marked in dirty_rows are copied back from the original
+        k-space unless the size of the arrays has been changed.
+        """
+        if self.kspacedata.shape != self.orig_kspacedata.shape:
+            self.resize_arrays(self.orig_kspacedata.shape)
+            self.dirty_rows[:] = True
+
+        if self.dirty_rows.all():
+            self.kspacedata[:] = self.orig_kspacedata
+        elif self.dirty_rows.any():
+            self.kspacedata[self.dirty_rows] = \
+                self.orig_kspacedata[self.dirty_rows]
+        self.dirty_rows[:] = False
 
     @staticmethod
-    def reduced_scan_percentage(kspace: np.ndarray, percentage: float):
+    def reduced_scan_percentage(kspace: np.ndarray, percentage: float,
+                                dirty_rows: np.ndarray = None):
         """Deletes a percentage of lines from the kspace in phase direction
 
         Deletes an equal number of lines from the top and bottom of kspace
@@ -286,6 +783,7 @@ class ImageManipulators:
         Parameters:
             kspace (np.ndarray): Complex kspace data
             percentage (float): The percentage of lines sampled (0.0 - 100.0)
+            dirty_rows (np.ndarray): optional row flags to mark modified lines
         """
 
         if int(percentage) < 100:
@@ -294,9 +792,76 @@ class ImageManipulators:
             if lines_to_delete:
                 kspace[0:lines_to_delete] = 0
                 kspace[-lines_to_delete:] = 0
+                if dirty_rows is not None:
+                    dirty_rows[0:lines_to_delete] = True
+                    dirty_rows[-lines_to_delete:] = True
 
     @staticmethod
-    def high_pass_filter(kspace: np.ndarray, radius: float):
+    def filter_radius(shape: (int, int), radius: float) -> float:
+        """Converts the relative filter radius (percent) to pixels
+
+        The radius is a ratio of the length of the image diagonally and it is
+        rounded to 0.01 percent, the precision the filter masks are cached at.
+
+        Parameters:
+            shape (int, int): shape of the k-space
+            radius (float): Relative size of the kspace mask circle (percent)
+        """
+        return np.hypot(*shape) / 2 * round(radius * 100) / 10000
+
+    @classmethod
+    def radius_squared(cls, shape: (int, int)) -> np.ndarray:
+        """Returns the cached squared distance of each point from the center
+
+        Only depends on the shape, so a new filter radius (e.g. while the
+        slider is dragged) only needs a comparison to build its mask.
+
+        Parameters:
+            shape (int, int): shape of the k-space
+        """
+        r2 = cls._r2_cache.get(shape)
+        if r2 is None:
+            rows, cols = shape
+            a, b = rows // 2, cols // 2
+            y, x = np.ogrid[-a:rows - a, -b:cols - b]
+            r2 = (x * x + y * y).astype(np.int32)
+            r2.setflags(write=False)
+            cls._r2_cache[shape] = r2
+        return r2
+
+    @classmethod
+    def circular_mask(cls, shape: (int, int), radius: float, outside: bool):
+        """Returns a cached boolean mask of a circle centered on k-space
+
+        The circle's radius is determined by the 'radius' float variable
+        (0.0 - 100) as ratio of the length of the image diagonally. Masks are
+        cached by shape and radius (to 0.01 percent) so that redrawing with an
+        unchanged filter slider does not rebuild them.
+
+        Parameters:
+            shape (int, int): shape of the k-space
+            radius (float): Relative size of the kspace mask circle (percent)
+            outside (bool): True to mask outside the circle instead of inside
+
+        Returns:
+            np.ndarray: read-only boolean mask, True where kspace is removed
+        """
+        radius_q = round(radius * 100)
+        key = (shape, radius_q, outside)
+        mask = cls._mask_cache.get(key)
+        if mask is None:
+            if len(cls._mask_cache) >= cls._mask_cache_size:
+                cls._mask_cache.clear()
+            r = cls.filter_radius(shape, radius)
+            mask = cls.radius_squared(shape) <= r * r
+            if outside:
+                np.logical_not(mask, out=mask)
+            mask.setflags(write=False)
+            cls._mask_cache[key] = mask
+        return mask
+
+    @classmethod
+    def high_pass_filter(cls, kspace: np.ndarray, radius: float):
         """High pass filter removes the low spatial frequencies from k-space
 
         This function deletes the center of kspace by removing values
@@ -310,15 +875,10 @@ class ImageManipulators:
         """
 
         if radius > 0:
-            r = np.hypot(*kspace.shape) / 2 * radius / 100
-            rows, cols = np.array(kspace.shape, dtype=int)
-            a, b = np.floor(np.array((rows, cols)) / 2).astype(int)
-            y, x = np.ogrid[-a:rows - a, -b:cols - b]
-            mask = x * x + y * y <= r * r
-            kspace[mask] = 0
+            kspace[cls.circular_mask(kspace.shape, radius, False)] = 0
 
-    @staticmethod
-    def low_pass_filter(kspace: np.ndarray, radius: float):
+    @classmethod
+    def low_pass_filter(cls, kspace: np.ndarray, radius: float):
         """Low pass filter removes the high spatial frequencies from k-space
 
         This function only keeps the center of kspace by removing values
@@ -332,15 +892,10 @@ class ImageManipulators:
         """
 
         if radius < 100:
-            r = np.hypot(*kspace.shape) / 2 * radius / 100
-            rows, cols = np.array(kspace.shape, dtype=int)
-            a, b = np.floor(np.array((rows, cols)) / 2).astype(int)
-            y, x = np.ogrid[-a:rows - a, -b:cols - b]
-            mask = x * x + y * y <= r * r
-            kspace[~mask] = 0
+            kspace[cls.circular_mask(kspace.shape, radius, True)] = 0
 
-    @staticmethod
-    def add_noise(kspace: np.ndarray, signal_to_noise: float,
+    @classmethod
+    def add_noise(cls, kspace: np.ndarray, signal_to_noise: float,
                   current_noise: np.ndarray, generate_new_noise=False):
         """Adds random Guassian white noise to k-space
 
@@ -351,7 +906,7 @@ class ImageManipulators:
         Parameters:
             kspace (np.ndarray): Complex kspace ndarray
             signal_to_noise (float): SNR in decibels (-30dB - +30dB)
-            current_noise (np.ndarray): the existing noise map
+            current_noise (np.ndarray): the existing noise map (float32)
             generate_new_noise (bool): flag to generate new noise map
         """
 
@@ -359,11 +914,14 @@ class ImageManipulators:
             if generate_new_noise:
                 mean_signal = np.mean(np.abs(kspace))
                 std_noise = mean_signal / np.power(10, (signal_to_noise / 20))
-                current_noise[:] = std_noise * np.random.randn(*kspace.shape)
-            kspace += current_noise
+                # Generated in place at single precision
+                cls._rng.standard_normal(dtype=np.float32, out=current_noise)
+                current_noise *= std_noise
+            kspace.real += current_noise  # Noise map is real
 
     @staticmethod
-    def partial_fourier(kspace: np.ndarray, percentage: float, zf: bool):
+    def partial_fourier(kspace: np.ndarray, percentage: float, zf: bool,
+                        dirty_rows: np.ndarray = None):
         """ Partial Fourier
 
         Also known as half scan - only acquire a little over half of k-space
@@ -373,11 +931,14 @@ class ImageManipulators:
             kspace (np.ndarray): Complex k-space
             percentage (float): Sampled k-space percentage
             zf (bool): Zero-fill k-space instead of using symmetry
+            dirty_rows (np.ndarray): optional row flags to mark modified lines
         """
 
         if int(percentage) != 100:
             percentage = 1 - percentage / 100
             rows_to_skip = round(percentage * (kspace.shape[0] / 2 - 1))
+            if rows_to_skip and dirty_rows is not None:
+                dirty_rows[-rows_to_skip:] = True
             if rows_to_skip and zf:
                 # Partial Fourier (lines not acquired are filled with zeros)
                 kspace[-rows_to_skip:] = 0
@@ -394,19 +955,42 @@ class ImageManipulators:
                 shift_ver = 0 if kspace.shape[0] % 2 else 1  # Ternary operator
                 s = (shift_ver, shift_hor)
 
-                # 1. Obtain a view of the array backwards (rotated 180 degrees)
-                # 2. If the peak is off center horizontally (e.g. number of
-                #       columns or rows is even) roll lines to realign the
-                #       highest amplitude parts
-                # 3. Do the same vertically
-                kspace[-rows_to_skip:] = \
-                    np.roll(kspace[::-1, ::-1], s, axis=(0, 1))[-rows_to_skip:]
+                # Source of the replaced lines is the array backwards (rotated
+                # 180 degrees) and rolled by s to realign the highest
+                # amplitude parts if the peak is off center. Only the replaced
+                # lines are indexed instead of rolling the whole array:
+                # np.roll(kspace[::-1, ::-1], s)[i, j] ==
+                #     kspace[(s[0] - 1 - i) % rows, (s[1] - 1 - j) % columns]
+                rows, cols = kspace.shape
+                src_rows = s[0] - 1 - np.arange(rows - rows_to_skip, rows)
+                src_cols = s[1] - 1 - np.arange(cols)
+                src = np.ix_(src_rows % rows, src_cols % cols)
 
                 # Conjugate replaced lines
-                np.conj(kspace[-rows_to_skip:], kspace[-rows_to_skip:])
+                np.conj(kspace[src], out=kspace[-rows_to_skip:])
 
-    @staticmethod
-    def hamming(kspace: np.ndarray):
+    @classmethod
+    def hamming_window(cls, shape: (int, int)):
+        """Returns the cached row and column Hamming windows for a shape
+
+        Parameters:
+            shape (int, int): shape of the k-space
+
+        Returns:
+            tuple: float32 row (column vector) and column (row vector)
+            windows, and the column window with each value repeated for the
+            interleaved float32 view of complex k-space
+        """
+        window = cls._hamming_cache.get(shape)
+        if window is None:
+            win_cols = np.hamming(shape[1]).astype(np.float32)[None, :]
+            window = (np.hamming(shape[0]).astype(np.float32)[:, None],
+                      win_cols, np.repeat(win_cols, 2, axis=1))
+            cls._hamming_cache[shape] = window
+        return window
+
+    @classmethod
+    def hamming(cls, kspace: np.ndarray):
         """ Hamming filter
 
         Applies a 2D Hamming filter to reduce Gibbs ringing
@@ -415,15 +999,56 @@ class ImageManipulators:
             https://www.ncbi.nlm.nih.gov/pmc/articles/PMC4058219/
             https://www.roberthovden.com/tutorial/2015/fftartifacts.html
 
+        The 2D window is the outer product of two 1D windows, so instead of
+        building the full window the k-space is multiplied by the row and
+        column windows separately. The 1D windows are cached by k-space shape.
+        The window is real, so complex64 k-space is multiplied through the
+        float32 view of the interleaved real and imaginary parts instead of a
+        complex multiply.
+
         Parameters:
             kspace: Complex k-space numpy.ndarray
         """
-        x, y = kspace.shape
-        window = np.outer(np.hamming(x), np.hamming(y))
-        kspace *= window
+        win_rows, win_cols, win_cols_iq = cls.hamming_window(kspace.shape)
+        if kspace.dtype != np.complex64:
+            # e.g. complex128 raw data, the float32 view would not match
+            np.multiply(kspace, win_rows, out=kspace)
+            np.multiply(kspace, win_cols, out=kspace)
+            return
+        ksp_float = kspace.view(np.float32)  # [real, imag, real, imag, ...]
+        np.multiply(ksp_float, win_rows, out=ksp_float)
+        np.multiply(ksp_float, win_cols_iq, out=ksp_float)
 
-    @staticmethod
-    def undersample(kspace: np.ndarray, factor: int, compress: bool):
+    @classmethod
+    def fused_filters(cls, kspace: np.ndarray, hp_radius: float,
+                      lp_radius: float, factor: int, hamming: bool):
+        """Applies the multiplicative filters in a single pass (needs numba)
+
+        High pass, low pass, undersampling without compression and Hamming
+        filters all scale or zero individual k-space points, so they can be
+        applied together while k-space is read and written only once.
+
+        Parameters:
+            kspace (np.ndarray): Complex kspace ndarray
+            hp_radius (float): High pass filter radius (percent)
+            lp_radius (float): Low pass filter radius (percent)
+            factor (int): Undersampling factor
+            hamming (bool): Apply Hamming filter
+        """
+        shape = kspace.shape
+        hp_r2 = cls.filter_radius(shape, hp_radius) ** 2 \
+            if hp_radius > 0 else -1.
+        lp_r2 = cls.filter_radius(shape, lp_radius) ** 2 \
+            if lp_radius < 100 else np.inf
+        if hamming:
+            win_rows, win_cols = \
+                (w.ravel() for w in cls.hamming_window(shape)[:2])
+        else:
+            win_rows = win_cols = np.empty(0, dtype=np.float32)
+        _fused_filters(kspace, hp_r2, lp_r2, max(factor, 1),
+                       win_rows, win_cols)
+
+    def undersample(self, kspace: np.ndarray, factor: int, compress: bool):
         """ Skipping every nth kspace line
 
         Simulates acquiring every nth (where n is the acceleration factor) line
@@ -434,34 +1059,37 @@ class ImageManipulators:
             factor: Only scan every nth line (n=factor) starting from midline
             compress: compress kspace by removing empty lines (rectangular FOV)
         """
-        # TODO memory optimise this (kspace sized memory created 3 times)
         if factor > 1:
-            mask = np.ones(kspace.shape, dtype=bool)
+            keep = np.zeros(kspace.shape[0], dtype=bool)  # Sampled lines
             midline = kspace.shape[0] // 2
-            mask[midline::factor] = 0
-            mask[midline::-factor] = 0
+            keep[midline::factor] = True
+            keep[midline::-factor] = True
             if compress:
-                q = kspace[~mask]
-                q = q.reshape(q.size // kspace.shape[1], kspace.shape[1])
-                im.resize_arrays(q.shape)
+                q = kspace[keep]
+                self.resize_arrays(q.shape)
                 kspace[:] = q[:]
             else:
-                kspace[mask] = 0
+                kspace[~keep] = 0
 
     @staticmethod
-    def decrease_dc(kspace: np.ndarray, percentage: int):
+    def decrease_dc(kspace: np.ndarray, percentage: int,
+                    dirty_rows: np.ndarray = None):
         """Decreases the highest peak in kspace (DC signal)
 
         Parameters:
             kspace: Complex k-space numpy.ndarray
             percentage: reduce the DC value by this value
+            dirty_rows: optional row flags to mark modified lines
         """
         x = kspace.shape[0] // 2
         y = kspace.shape[1] // 2
         kspace[x, y] *= (100 - percentage) / 100
+        if dirty_rows is not None:
+            dirty_rows[x] = True
 
     @staticmethod
-    def apply_spikes(kspace: np.ndarray, spikes: list):
+    def apply_spikes(kspace: np.ndarray, spikes: list,
+                     dirty_rows: np.ndarray = None):
         """Overlays spikes to kspace
 
         Apply spikes (max value pixels) to the kspace data at the specified
@@ -470,13 +1098,16 @@ class ImageManipulators:
         Parameters:
             kspace (np.ndarray): Complex kspace ndarray
             spikes (list): coordinates for the spikes (row, column)
+            dirty_rows (np.ndarray): optional row flags to mark modified lines
         """
-        spike_intensity = np.max(kspace) * 2
-        for spike in spikes:
-            kspace[spike] = spike_intensity
+        if spikes:
+            rows, cols = np.array(spikes, dtype=np.intp).T
+            kspace[rows, cols] = np.max(kspace) * 2
+            if dirty_rows is not None:
+                dirty_rows[rows] = True
 
     @staticmethod
-    def apply_patches(kspace, patches: list):
+    def apply_patches(kspace, patches: list, dirty_rows: np.ndarray = None):
         """Applies patches to kspace
 
          Apply patches (zero value squares) to the kspace data at the
@@ -485,14 +1116,17 @@ class ImageManipulators:
          Parameters:
              kspace (np.ndarray): Complex kspace ndarray
              patches (list): coordinates for the spikes (row, column, radius)
+             dirty_rows (np.ndarray): optional row flags to mark modified lines
          """
         for patch in patches:
             x, y, size = patch[0], patch[1], patch[2]
             kspace[max(x - size, 0):x + size + 1,
                    max(y - size, 0):y + size + 1] = 0
+            if dirty_rows is not None:
+                dirty_rows[max(x - size, 0):x + size + 1] = True
 
-    @staticmethod
-    def filling(kspace: np.ndarray, value: float, mode: int):
+    def filling(self, kspace: np.ndarray, value: float, mode: int,
+                dirty_rows: np.ndarray = None):
         """Receives kspace filling UI changes and redirects to filling methods
 
         When the kspace filling simulation slider changes or simulation plays,
@@ -502,19 +1136,21 @@ class ImageManipulators:
             kspace (np.ndarray): Complex kspace ndarray
             value (float): acquisition phase in percent
             mode (int): kspace filling mode
+            dirty_rows (np.ndarray): optional row flags to mark modified lines
         """
         if mode == 0:  # Linear filling
-            im.filling_linear(kspace, value)
+            self.filling_linear(kspace, value, dirty_rows)
         elif mode == 1:  # Centric filling
-            im.filling_centric(kspace, value)
+            self.filling_centric(kspace, value, dirty_rows)
         elif mode == 2:  # Single shot EPI blipped
-            im.filling_ss_epi_blipped(kspace, value)
+            self.filling_ss_epi_blipped(kspace, value, dirty_rows)
         elif mode == 3:  # Archimedean spiral
-            # im.filling_spiral(kspace, value)
+            # self.filling_spiral(kspace, value)
             pass
 
     @staticmethod
-    def filling_linear(kspace: np.ndarray, value: float):
+    def filling_linear(kspace: np.ndarray, value: float,
+                       dirty_rows: np.ndarray = None):
         """Linear kspace filling
 
         Starts with the top left corner and sequentially fills kspace from
@@ -522,40 +1158,89 @@ class ImageManipulators:
         Parameters:
             kspace (np.ndarray): Complex kspace ndarray
             value (float): acquisition phase in percent
+            dirty_rows (np.ndarray): optional row flags to mark modified lines
         """
-        kspace.flat[int(kspace.size * value // 100)::] = 0
+        cutoff = int(kspace.size * value // 100)
+        kspace.flat[cutoff::] = 0
+        if dirty_rows is not None:
+            dirty_rows[cutoff // kspace.shape[1]:] = True
 
-    @staticmethod
-    def filling_centric(kspace: np.ndarray, value: float):
+    @classmethod
+    def centric_order(cls, rows: int):
+        """Returns the cached acquisition order of lines for centric filling
+
+        The center line is first, then alternating one line above and one
+        line below it.
+
+        Parameters:
+            rows (int): number of k-space lines
+
+        Returns:
+            np.ndarray: line indices in the order of acquisition
+        """
+        order = cls._centric_cache.get(rows)
+        if order is None:
+            order = np.empty(rows, dtype=np.intp)
+            order[0::2] = np.arange(rows // 2, rows)
+            order[1::2] = np.arange(rows // 2 - 1, -1, -1)
+            order.setflags(write=False)
+            cls._centric_cache[rows] = order
+        return order
+
+    @classmethod
+    def filling_centric(cls, kspace: np.ndarray, value: float,
+                        dirty_rows: np.ndarray = None):
         """ Centric filling method
 
         Fills the center line first from left to right and then alternating one
         line above and one below.
-        """
-        ksp_centric = np.zeros_like(kspace)
 
-        # reorder
-        ksp_centric[0::2] = kspace[kspace.shape[0] // 2::]
-        ksp_centric[1::2] = kspace[kspace.shape[0] // 2 - 1::-1]
-
-        ksp_centric.flat[int(kspace.size * value / 100)::] = 0
-
-        # original order
-        kspace[(kspace.shape[0]) // 2 - 1::-1] = ksp_centric[1::2]
-        kspace[(kspace.shape[0]) // 2::] = ksp_centric[0::2]
+        Parameters:
+            kspace (np.ndarray): Complex kspace ndarray
+            value (float): acquisition phase in percent
+            dirty_rows (np.ndarray): optional row flags to mark modified lines
+        """
+        # Only the lines not yet acquired are cleared, no reordering needed
+        row, col = divmod(int(kspace.size * value / 100), kspace.shape[1])
+        if row < kspace.shape[0]:
+            order = cls.centric_order(kspace.shape[0])[row:]
+            kspace[order[0], col:] = 0
+            kspace[order[1:]] = 0
+            if dirty_rows is not None:
+                dirty_rows[order] = True
 
     @staticmethod
-    def filling_ss_epi_blipped(kspace: np.ndarray, value: float):
+    def filling_ss_epi_blipped(kspace: np.ndarray, value: float,
+                               dirty_rows: np.ndarray = None):
         # Single-shot blipped EPI (zig-zag pattern)
         # https://www.imaios.com/en/e-Courses/e-MRI/MRI-Sequences/echo-planar-imaging
-        ksp_epi = np.zeros_like(kspace)
-        ksp_epi[::2] = kspace[::2]
-        ksp_epi[1::2] = kspace[1::2, ::-1]  # Every second line backwards
+        # Every second line is acquired backwards (right to left)
+        row, col = divmod(int(kspace.size * value / 100), kspace.shape[1])
+        if row < kspace.shape[0]:
+            if row % 2:
+                kspace[row, :kspace.shape[1] - col] = 0
+            else:
+                kspace[row, col:] = 0
+            kspace[row + 1:] = 0
+            if dirty_rows is not None:
+                dirty_rows[row:] = True
 
-        ksp_epi.flat[int(kspace.size * value / 100)::] = 0
 
-        kspace[::2] = ksp_epi[::2]
-        kspace[1::2] = ksp_epi[1::2, ::-1]
+class Worker(QRunnable):
+    """ Runs a function with the given arguments on a QThreadPool thread
+    """
+
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+
+    def run(self):
+        self.fn(*self.args)
+
+
+# objectName of the QML thumbnail images, thumb_{channel index}
+THUMB_NAME = re.compile(r'thumb_(\d+)')
 
 
 class MainApp(QObject):
@@ -563,6 +1248,13 @@ class MainApp(QObject):
     This class handles all interaction with the QML user interface
     """
 
+    # Emitted by the worker thread when new display data is ready
+    displays_ready = pyqtSignal()
+    # Emitted by the startup worker with the instance of the default image
+    default_loaded = pyqtSignal(object)
+    # Downsampling factor of the image while a slider is dragged
+    preview_scale = 2
+
     def __init__(self, context, parent=None):
         super().__init__(parent)
         self.win = parent
@@ -590,6 +1282,35 @@ class MainApp(QObject):
         for ctrl in ctrls:
             setattr(self, "ui_" + ctrl, bind(ctrl))
 
+        # Properties of the controls read on every update. Their values are
+        # kept in ui_values by the notify signals of the properties, so an
+        # update does not need a meta-object call for each of them
+        self.ui_values = {}
+        self.ui_properties = []
+        for ctrl, prop in [("noise_slider", "value"), ("rdc_slider", "value"),
+                           ("rdc_slider", "enabled"),
+                           ("partial_fourier_slider", "value"),
+                           ("partial_fourier_slider", "enabled"),
+                           ("zero_fill", "checked"),
+                           ("high_pass_slider", "value"),
+                           ("low_pass_slider", "value"),
+                           ("undersample_kspace", "value"),
+                           ("compress", "checked"), ("decrease_dc", "value"),
+                           ("hamming", "checked"), ("filling", "value"),
+                           ("filling_mode", "currentIndex"),
+                           ("ksp_const", "value"), ("image_display", "ww"),
+                           ("image_display", "wc")]:
+            self.watch_property(ctrl, prop)
+
+        # While one of these sliders is dragged, a low resolution preview is
+        # reconstructed. The full image is updated when it is released
+        self.drag_sliders = ["noise_slider", "rdc_slider",
+                             "partial_fourier_slider", "high_pass_slider",
+                             "low_pass_slider", "undersample_kspace",
+                             "decrease_dc", "filling"]
+        for ctrl in self.drag_sliders:
+            self.watch_property(ctrl, "pressed", self.drag_changed)
+
         # Initialise an empty list of image paths that can later be filled
         self.url_list = []
         self.current_img = 0
@@ -598,6 +1319,110 @@ class MainApp(QObject):
         self.channels = 1
         self.img_instances = {}
 
+        # K-space modifiers run on a worker thread. While it is busy, only
+        # the latest requested update is kept (older ones are dropped)
+        self.update_lock = threading.Lock()
+        self.pending_update = None
+        self.update_running = False
+        # Notified (with update_lock held) when the worker has finished
+        self.update_done = threading.Condition(self.update_lock)
+        # Image and parameters of the last update, repeated ones are skipped
+        self.last_update = None
+        self.displays_ready.connect(self.refresh_displays)
+        self.default_loaded.connect(self.show_default)
+        # Update requests (e.g. dragging a slider) are collected for 16 ms
+        # and only the state of the UI at the end of it is applied
+        self.update_timer = QTimer(self)
+        self.update_timer.setSingleShot(True)
+        self.update_timer.setInterval(16)
+        self.update_timer.timeout.connect(self.start_update)
+
+    def watch_property(self, ctrl: str, prop: str, callback=None):
+        """Caches the value of a QML property in ui_values
+
+        The value is updated whenever the notify signal of the property is
+        emitted. Properties without a notify signal are not cached and are
+        read directly by ui_value.
+
+        Parameters:
+            ctrl (str): name of the bound control (without the ui_ prefix)
+            prop (str): name of the property
+            callback: optional function called after the value changed
+        """
+        qml_prop = QQmlProperty(getattr(self, "ui_" + ctrl), prop)
+
+        def changed():
+            self.ui_values[ctrl, prop] = qml_prop.read()
+            if callback is not None:
+                callback()
+
+        if qml_prop.hasNotifySignal() and \
+                qml_prop.connectNotifySignal(changed):
+            self.ui_values[ctrl, prop] = qml_prop.read()
+            # The property handle has to outlive the connection
+            self.ui_properties.append(qml_prop)
+
+    def ui_value(self, ctrl: str, prop: str):
+        """Returns the value of a QML property, cached if possible
+
+        Parameters:
+            ctrl (str): name of the bound control (without the ui_ prefix)
+            prop (str): name of the property
+
+        Returns:
+            The current value of the property
+        """
+        try:
+            return self.ui_values[ctrl, prop]
+        except KeyError:
+            return getattr(self, "ui_" + ctrl).property(prop)
+
+    def dragging(self) -> bool:
+        """Returns True while one of the drag_sliders is pressed"""
+        return any(self.ui_value(ctrl, "pressed")
+                   for ctrl in self.drag_sliders)
+
+    def drag_changed(self):
+        """Updates the full resolution image when a slider is released"""
+        if not self.dragging():
+            self.update_displays()
+
+    def load_default(self, path: str):
+        """Opens the default image on a worker thread at startup
+
+        The placeholder image is replaced by show_default on the UI thread.
+
+        Parameters:
+            path (str): location of the default image
+        """
+        try:
+            default_im = ImageManipulators(open_cached(path), is_image=True,
+                                           copy=False)
+        except Exception:
+            # Any error ends up in show_default, an exception raised here
+            # would leave the placeholder on the screen without a message
+            log.exception(f'Cannot load the default image ({path})')
+            default_im = None
+        self.default_loaded.emit(default_im)
+
+    def show_default(self, default_im):
+        """Replaces the startup placeholder with the default image
+
+        Parameters:
+            default_im (ImageManipulators): default image or None on error
+        """
+        global im
+        if self.url_list:
+            # An image was opened while the default image was loading
+            return
+        if default_im is None:
+            # Quit gracefully as the app can not start without it
+            qt_msgbox('Cannot load the default image.', fatal=True)
+            return
+        im = default_im
+        self.last_update = None  # Does not keep the placeholder alive
+        self.update_displays()
+
     def execute_load(self):
         """ Replaces the ImageManipulators class therefore changing the image
 
@@ -630,6 +1455,9 @@ class MainApp(QObject):
                     ImageManipulators(file_data, self.is_image)
             im = self.img_instances[0]
 
+        # The previous image is not kept alive by the last update
+        self.last_update = None
+
         # Let the QML thumbnails list know about the number of channels
         self.ui_thumbnails.setProperty("model", self.channels)
 
@@ -699,14 +1527,24 @@ class MainApp(QObject):
         log.info(f'Saving to file. Requested path: {filename}, format: {ext}')
         k_path = filename + '_k' + ext
         i_path = filename + '_i' + ext
+        # The pending update is finished first, so both files are from the
+        # same update and the worker does not write the arrays being copied
+        with self.update_done:
+            self.update_done.wait_for(lambda: not self.update_running)
+        with im.display_lock:
+            img = im.img.copy()
+            ksp = im.kspace_display_data.copy()
+        # The image is windowed as on the display
+        im.apply_window(img, {'ww': self.ui_value("image_display", "ww"),
+                              'wc': self.ui_value("image_display", "wc")})
         if ext.lower() == '.tiff':
-            img_to_export = Image.fromarray(im.img)
-            ksp_to_export = Image.fromarray(im.kspace_display_data)
+            img_to_export = Image.fromarray(img)
+            ksp_to_export = Image.fromarray(ksp)
         else:
             log.info(f'Converting image for export')
-            img_to_export = Image.fromarray(im.img).convert(mode='L')
+            img_to_export = Image.fromarray(img).convert(mode='L')
             log.info(f'Converting k-space for export')
-            ksp_to_export = Image.fromarray(im.kspace_display_data).convert(mode='L')
+            ksp_to_export = Image.fromarray(ksp).convert(mode='L')
 
         try:
             log.info(f'Attempting to export image')
@@ -769,9 +1607,52 @@ class MainApp(QObject):
 
     @pyqtSlot(name="update_displays")
     def update_displays(self):
-        """Triggers modifiers to kspace and updates the displays"""
-        self.image_change()
+        """Triggers modifiers to kspace and updates the displays
 
+        The update starts when the update timer expires, so that a burst of
+        UI changes results in a single update.
+        """
+        if not self.update_timer.isActive():
+            self.update_timer.start()
+
+    def start_update(self):
+        """Starts updating the displays with the current state of the UI
+
+        The UI parameters are read here, on the UI thread, and the modifiers
+        are applied on a worker thread. The displays are refreshed when the
+        worker is done. Nothing is done if neither the image nor the
+        parameters have changed since the last update.
+        """
+        update = (im, self.ui_parameters())
+        if update == self.last_update:
+            return
+        self.last_update = update
+        with self.update_lock:
+            self.pending_update = update
+            if self.update_running:
+                return
+            self.update_running = True
+        QThreadPool.globalInstance().start(Worker(self.update_worker))
+
+    def update_worker(self):
+        """Applies the pending updates until there are no more left"""
+        while True:
+            with self.update_lock:
+                update, self.pending_update = self.pending_update, None
+                if update is None:
+                    self.update_running = False
+                    self.update_done.notify_all()
+                    return
+            try:
+                self.image_change(*update)
+            except Exception:
+                log.error("Failed to update the displays", exc_info=True)
+                # The same parameters are applied again on the next request
+                self.last_update = None
+            self.displays_ready.emit()
+
+    def refresh_displays(self):
+        """Makes the QML Image elements reload the display data"""
         # Replacing image source for QML Image elements - this will trigger
         # requestPixmap. The image name must be different for Qt to display the
         # new one, so a random string is appended to the end
@@ -780,86 +1661,156 @@ class MainApp(QObject):
         self.ui_image_display. \
             setProperty("source", "image://imgs/image_%s" % uuid4().hex)
 
-        #  Iterate through thumbnails and set source image to trigger reload
+        #  Iterate through thumbnails and set source image to trigger reload.
+        # The display version is used instead of a random string so that
+        # thumbnails of unchanged channels are not reloaded
         for item in self.ui_thumbnails.childItems()[0].childItems():
             try:
-                oname = item.childItems()[0].property("objectName")
-                source = "image://imgs/" + oname + "_%s" % uuid4().hex
-                item.childItems()[0].setProperty("source", source)
-            except IndexError:
+                thumb = item.childItems()[0]
+                oname = thumb.property("objectName")
+                im_c = self.img_instances[int(THUMB_NAME.match(oname)[1])]
+                source = "image://imgs/%s_%d" % (oname, im_c.version)
+                if thumb.property("source").toString() != source:
+                    thumb.setProperty("source", source)
+            except (IndexError, KeyError, TypeError):
                 # Highlight component of the ListView does not have childItems
+                # and thumbnails of a previous image may not exist any more
                 pass
 
-    def image_change(self):
-        """ Apply kspace modifiers to kspace and get resulting image"""
+    def ui_parameters(self) -> dict:
+        """Reads the state of the k-space modifier and display controls
+
+        QML objects can only be accessed from the UI thread, so the values
+        are collected here (mostly from ui_values) before the worker thread
+        applies them.
+
+        Returns:
+            dict: parameters used by image_change
+        """
+        value = self.ui_value
+        return {
+            'snr': value("noise_slider", "value"),
+            'spikes': tuple(im.spikes),
+            'patches': tuple(im.patches),
+            'rdc': value("rdc_slider", "value")
+            if value("rdc_slider", "enabled") else None,
+            'pf': value("partial_fourier_slider", "value")
+            if value("partial_fourier_slider", "enabled") else None,
+            'zf': value("zero_fill", "checked"),
+            'hp_radius': value("high_pass_slider", "value"),
+            'lp_radius': value("low_pass_slider", "value"),
+            'factor': int(value("undersample_kspace", "value")),
+            'compress': value("compress", "checked"),
+            'dc': int(value("decrease_dc", "value")),
+            'hamming': value("hamming", "checked"),
+            'filling': value("filling", "value"),
+            'filling_mode': value("filling_mode", "currentIndex"),
+            'kspace_const': int(value("ksp_const", "value")),
+            'ww': value("image_display", "ww"),
+            'wc': value("image_display", "wc"),
+            'preview_scale': self.preview_scale if self.dragging() else 1,
+        }
+
+    @classmethod
+    def image_change(cls, im: ImageManipulators, p: dict):
+        """ Apply kspace modifiers to kspace and update the displays
+
+        Changes to the display settings only (k-space scaling and window)
+        do not run the modifiers and the inverse FFT again.
+
+        Parameters:
+            im (ImageManipulators): image to be modified
+            p (dict): UI parameters (see ui_parameters)
+        """
+        modifiers = {k: v for k, v in p.items()
+                     if k not in ('kspace_const', 'ww', 'wc')}
+        if modifiers != im.applied_modifiers:
+            im.applied_modifiers = None
+            cls.apply_modifiers(im, p)
+            im.applied_modifiers = modifiers
+
+        # Get display properties
+        kspace_const = p['kspace_const']
+        # Window values
+        win_val = {'ww': p['ww'], 'wc': p['wc']}
+        im.prepare_displays(kspace_const, win_val)
+
+    @staticmethod
+    def apply_modifiers(im: ImageManipulators, p: dict):
+        """ Apply kspace modifiers to kspace and get resulting image
+
+        Parameters:
+            im (ImageManipulators): image to be modified
+            p (dict): UI parameters (see ui_parameters)
+        """
 
         # Get a copy of the original k-space data to play with
-        im.resize_arrays(im.orig_kspacedata.shape)
-        im.kspacedata[:] = im.orig_kspacedata
+        im.reset_kspace()
 
         # 01 - Noise
-        new_snr = self.ui_noise_slider.property('value')
+        new_snr = p['snr']
         generate_new = False
         if new_snr != im.signal_to_noise:
             generate_new = True
             im.signal_to_noise = new_snr
         im.add_noise(im.kspacedata, new_snr, im.noise_map, generate_new)
+        if new_snr < 30:
+            im.dirty_rows[:] = True
 
         # 02 - Spikes
-        im.apply_spikes(im.kspacedata, im.spikes)
+        im.apply_spikes(im.kspacedata, p['spikes'], im.dirty_rows)
 
         # 03 - Patches
-        im.apply_patches(im.kspacedata, im.patches)
+        im.apply_patches(im.kspacedata, p['patches'], im.dirty_rows)
 
         # 04 - Reduced scan percentage
-        if self.ui_rdc_slider.property("enabled"):
-            v_ = self.ui_rdc_slider.property("value")
-            im.reduced_scan_percentage(im.kspacedata, v_)
+        if p['rdc'] is not None:
+            im.reduced_scan_percentage(im.kspacedata, p['rdc'], im.dirty_rows)
 
         # 05 - Partial fourier
-        if self.ui_partial_fourier_slider.property("enabled"):
-            v_ = self.ui_partial_fourier_slider.property("value")
-            zf = self.ui_zero_fill.property("checked")
-            im.partial_fourier(im.kspacedata, v_, zf)
-
-        # 06 - High pass filter
-        v_ = self.ui_high_pass_slider.property("value")
-        im.high_pass_filter(im.kspacedata, v_)
-
-        # 07 - Low pass filter
-        v_ = self.ui_low_pass_slider.property("value")
-        im.low_pass_filter(im.kspacedata, v_)
-
-        # 08 - Undersample k-space
-        v_ = self.ui_undersample_kspace.property("value")
-        if int(v_):
-            compress = self.ui_compress.property("checked")
-            im.undersample(im.kspacedata, int(v_), compress)
-
-        # 09 - DC signal decrease
-        v_ = self.ui_decrease_dc.property("value")
-        if int(v_) > 1:
-            im.decrease_dc(im.kspacedata, int(v_))
-
-        # 10 - Hamming filter
-        if self.ui_hamming.property("checked"):
-            im.hamming(im.kspacedata)
+        if p['pf'] is not None:
+            im.partial_fourier(im.kspacedata, p['pf'], p['zf'], im.dirty_rows)
+
+        hp_radius, lp_radius = p['hp_radius'], p['lp_radius']
+        factor, compress = p['factor'], p['compress']
+        dc, hamming = p['dc'], p['hamming']
+        if hp_radius > 0 or lp_radius < 100 or factor > 1 or hamming:
+            im.dirty_rows[:] = True
+
+        if nb and not (factor > 1 and compress):
+            # 06 - 10 Steps below only scale or zero k-space points so they
+            # are applied at once
+            if dc > 1:
+                im.decrease_dc(im.kspacedata, dc, im.dirty_rows)
+            im.fused_filters(im.kspacedata, hp_radius, lp_radius, factor,
+                             hamming)
+        else:
+            # 06 - High pass filter
+            im.high_pass_filter(im.kspacedata, hp_radius)
+
+            # 07 - Low pass filter
+            im.low_pass_filter(im.kspacedata, lp_radius)
+
+            # 08 - Undersample k-space
+            if factor:
+                im.undersample(im.kspacedata, factor, compress)
+
+            # 09 - DC signal decrease
+            if dc > 1:
+                im.decrease_dc(im.kspacedata, dc, im.dirty_rows)
+
+            # 10 - Hamming filter
+            if hamming:
+                im.hamming(im.kspacedata)
 
         # 11 - Acquisition simulation progress
-        if self.ui_filling.property("value") < 100:
-            mode = self.ui_filling_mode.property("currentIndex")
-            im.filling(im.kspacedata, self.ui_filling.property("value"), mode)
+        if p['filling'] < 100:
+            im.filling(im.kspacedata, p['filling'], p['filling_mode'],
+                       im.dirty_rows)
 
         # Get the resulting image
-        im.np_ifft(kspace=im.kspacedata, out=im.img)
-
-        # Get display properties
-        kspace_const = int(self.ui_ksp_const.property('value'))
-        # Window values
-        ww = self.ui_image_display.property("ww")
-        wc = self.ui_image_display.property("wc")
-        win_val = {'ww': ww, 'wc': wc}
-        im.prepare_displays(kspace_const, win_val)
+        im.np_ifft(kspace=im.kspacedata, out=im.img,
+                   preview_scale=p['preview_scale'])
 
 
 class ImageProvider(QtQuick.QQuickImageProvider):
@@ -874,6 +1825,47 @@ class ImageProvider(QtQuick.QQuickImageProvider):
     def __init__(self):
         QtQuick.QQuickImageProvider. \
             __init__(self, QtQuick.QQuickImageProvider.Pixmap)
+        # Last pixmap of each display as {name: (display version, pixmap)}
+        self.pixmap_cache = {}
+        # Pointer to the display data of each display as {name: voidptr}
+        self.buffers = {}
+        # Image instance and name of its display data for each kind of
+        # requested image
+        self.displays = {
+            'image': (lambda name: im, 'image_display_data'),
+            'kspace': (lambda name: im, 'kspace_display_data'),
+            'thumb': (self.thumbnail, 'image_display_data'),
+        }
+
+    @staticmethod
+    def thumbnail(name: str):
+        """Returns the image instance of a thumbnail
+
+        Parameters:
+            name: thumbnail name ending with the channel index (thumb_{index})
+
+        Returns:
+            None if the name does not match a loaded channel
+        """
+        match = THUMB_NAME.match(name)
+        return py_mainapp.img_instances.get(int(match[1])) if match else None
+
+    def buffer(self, name: str, data: np.ndarray) -> sip.voidptr:
+        """Returns a pointer to the display data for the QImage constructor
+
+        The pointer is kept until the data is reallocated or resized, so the
+        buffer protocol of the array is not negotiated for each pixmap.
+
+        Parameters:
+            name (str): name of the display
+            data (np.ndarray): uint8 display data
+        """
+        ptr = self.buffers.get(name)
+        if ptr is None or int(ptr) != data.ctypes.data or \
+                ptr.getsize() != data.nbytes:
+            ptr = sip.voidptr(data.ctypes.data, data.nbytes, False)
+            self.buffers[name] = ptr
+        return ptr
 
     def requestPixmap(self, id_str: str, requested_size):
         """Qt calls this function when an image changes
@@ -885,39 +1877,32 @@ class ImageProvider(QtQuick.QQuickImageProvider):
         Returns:
             QPixmap: an image in the format required by Qt
         """
-        try:
-            if id_str.startswith('image'):
-                q_im = QImage(im.image_display_data,             # data
-                              im.image_display_data.shape[1],    # width
-                              im.image_display_data.shape[0],    # height
-                              im.image_display_data.strides[0],  # bytes/line
-                              QImage.Format_Grayscale8)          # format
-
-            elif id_str.startswith('kspace'):
-                q_im = QImage(im.kspace_display_data,             # data
-                              im.kspace_display_data.shape[1],    # width
-                              im.kspace_display_data.shape[0],    # height
-                              im.kspace_display_data.strides[0],  # bytes/line
-                              QImage.Format_Grayscale8)           # format
-
-            elif id_str.startswith('thumb'):
-                thumb_id = int(id_str[6:6+id_str[6:].find('_')])
-                im_c = py_mainapp.img_instances[thumb_id]
-                q_im = QImage(im_c.image_display_data,             # data
-                              im_c.image_display_data.shape[1],    # width
-                              im_c.image_display_data.shape[0],    # height
-                              im_c.image_display_data.strides[0],  # bytes/line
-                              QImage.Format_Grayscale8)            # format
-
-            else:
-                raise NameError
-
-        except NameError:
-            # On error, we return a red image of requested size
-            q_im = QPixmap(requested_size)
-            q_im.fill(QColor('red'))
-
-        return QPixmap(q_im), QPixmap(q_im).size()
+        # Image names are {kind}_{random} or thumb_{index}_{random}
+        name = id_str.rsplit('_', 1)[0]
+        display, attr = self.displays.get(name.split('_', 1)[0], (None, None))
+        im_c = display(name) if display else None
+        if im_c is None:
+            # Unknown images are replaced by a red image of requested size
+            pixmap = QPixmap(requested_size)
+            pixmap.fill(QColor('red'))
+            return pixmap, pixmap.size()
+
+        # The pixmap copies the data while the worker thread can not modify
+        # or resize it. Unchanged displays reuse the last pixmap
+        with im_c.display_lock:
+            data = getattr(im_c, attr)  # Current array while locked
+            version, pixmap = self.pixmap_cache.get(name, (None, None))
+            if version != im_c.version:
+                assert data.flags.c_contiguous
+                q_im = QImage(self.buffer(name, data),  # data
+                              data.shape[1],            # width
+                              data.shape[0],            # height
+                              data.strides[0],          # bytes/line
+                              QImage.Format_Grayscale8)  # format
+                pixmap = QPixmap.fromImage(q_im, Qt.NoFormatConversion)
+                self.pixmap_cache[name] = (im_c.version, pixmap)
+
+        return pixmap, pixmap.size()
 
 
 if __name__ == "__main__":
@@ -954,9 +1939,15 @@ if __name__ == "__main__":
     engine = QQmlApplicationEngine()
     ctx = engine.rootContext()
 
-    # Image manipulator and storage initialisation with default image
+    # Numba kernels are compiled in the background while the app loads
+    if nb:
+        QThreadPool.globalInstance().start(Worker(compile_kernels))
+
+    # Image manipulator and storage initialisation with a blank placeholder,
+    # the default image is loaded in the background
     engine.addImageProvider("imgs", ImageProvider())
-    im = ImageManipulators(open_file(default_image), is_image=True)
+    im = ImageManipulators(np.zeros((256, 256), dtype=np.float32),
+                           is_image=True, copy=False)
 
     # Loading GUI file
     # engine.load('ui_source/ui.qml')
@@ -965,7 +1956,11 @@ if __name__ == "__main__":
     win = engine.rootObjects()[0]
     py_mainapp = MainApp(ctx, win)
     ctx.setContextProperty("py_MainApp", py_mainapp)
+    QThreadPool.globalInstance().start(
+        Worker(py_mainapp.load_default, default_image))
 
     win.show()
 
-    sys.exit(app.exec_())
+    exit_code = app.exec_()
+    QThreadPool.globalInstance().waitForDone()
+    sys.exit(exit_code)